@@ -9,7 +9,9 @@ setup(
     install_requires=[
         "autopep8==1.6.0",
         "boto3==1.24.28",
+        "ijson==3.2.0",
         "isort==5.9.3",
+        "orjson==3.8.3",
         "pandas==1.4.2",
         "pylint==2.16.2",
         "pytest==7.2.2",
@@ -10,18 +10,37 @@ HUNTER_CLONE_PROJ_DIR = '/home/ec2-user/hunter_clone/hunter'
 HUNTER_CSV_PROJ_DIR = '/home/ec2-user/hunter_csv'
 NIGHTLY_RESULTS_DIR = '/home/ec2-user/nightly_results'
 
+# Buffer size (in bytes) when reading json files, to reduce the number of read() syscalls
+JSON_READ_BUFFER_SIZE = 1024 * 1024
+
+# Maximum number of threads reading or writing csv files concurrently
+CSV_IO_MAX_WORKERS = 8
+
+# Number of test runs sent at once to each worker process when generating the hunter csv
+# retrospectively, to amortise the inter-process communication over several (small) test runs
+TEST_RUNS_PER_PROCESS_CHUNK = 8
+
 # Date directory-related regex pattern
 DATE_DIR_REGEX_PATTERN = r'\d{4}_\d{2}_\d{2}'
 
+# Metrics' units-related regex pattern, i.e., any trailing unit after a number
+# (e.g., ' ms' in '1.23 ms', 'ms' in '1.23ms', ' op/sec' in '9966 op/sec', ' op/s' in '9966 op/s')
+METRIC_UNITS_REGEX_PATTERN = r'(?<=\d)\s*[A-Za-z/]+$'
+
 # Commit-related column names
 CASSANDRA_COL_NAME = 'commit'  # Name as expected by Hunter
 FALLOUT_TESTS_COL_NAME = 'fallout_tests_commit'
+# Commit columns are read as strings, so that Git shas made only of digits are not parsed as numbers
+COMMIT_COLS_DTYPES = {CASSANDRA_COL_NAME: str, FALLOUT_TESTS_COL_NAME: str}
 
 # Time and date formats
 FMT_TIME = '%H:%M:%S'
 FMT_Y_D_M = '%Y_%d_%m'
 FMT_Y_M_D = '%Y_%m_%d'
 
+# Translation table from a hunter date (e.g., '2022-01-01') to a date directory (e.g., '2022_01_01')
+HUNTER_DATE_TO_DIR_DATE = str.maketrans('-', '_')
+
 # Hunter csv file names and associated LWT tests-related constants
 HUNTER_FILE_FMT = '.csv'
 HUNTER_PREFIX = 'hunter-'
@@ -49,6 +68,9 @@ SUBSTR_TESTS_NAMES = [
 
 LWT_TEST_RUN_EXEC_TIME = '23:00:00'
 
+# Name of the json file with the performance results of each test run
+PERF_REPORT_JSON_NAME = 'performance-report.json'
+
 # Set to False only if generating hunter csv for the first time.
 PROSPECTIVE_MODE = True
 
@@ -107,10 +129,14 @@ LOG_FILE_W_MSG = 'regressions_sent_by_email.txt'
 TEMPLATE_MSG = 'Hello,\n\nPlease find the performance regressions detected ' \
                'by hunter as follows:\n\n\n\nBest regards,\n\nMarianne'
 
+# Template email message split once around where the regressions are inserted
+TEMPLATE_MSG_HEADER, TEMPLATE_MSG_FOOTER = TEMPLATE_MSG.split('\n\n\n', 1)
+
 # Receiver's email address
 RECEIVER_EMAIL = '<EMAIL_ADDRESS>'
 
 NEWLINE_SYMBOL = '\n'
+NEWLINE_BYTES = NEWLINE_SYMBOL.encode()
 
 LIST_OF_HUNTER_RESULTS_JSONS = [
     'hunter_result_fixed_100.json', 'hunter_result_fixed_1000.json',
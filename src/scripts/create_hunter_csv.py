@@ -3,33 +3,47 @@ This Python file seeks to create a csv file for Hunter to detect performance
 regressions (if any).
 """
 
-import glob
-import json
 import logging
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Tuple
 
+import ijson
 import pandas as pd
 
 from src.scripts.constants import (DATE_DIR_REGEX_PATTERN,
                                    DICT_OF_RENAMED_COLS,
                                    FALLOUT_TESTS_COL_NAME, HUNTER_CSV_PROJ_DIR,
                                    HUNTER_FILE_FMT, HUNTER_PREFIX,
+                                   JSON_READ_BUFFER_SIZE,
                                    LIST_OF_COLS_TO_EXTRACT, LIST_OF_CSV_NAMES,
                                    LWT_TEST_RUN_EXEC_TIME, LWT_TESTS_NAMES,
-                                   NIGHTLY_RESULTS_DIR, PROSPECTIVE_MODE,
-                                   SUBSTR_TESTS_NAMES, TUPLE_SUPPORTED_TESTS,
-                                   TWO_GIT_SHA_SUFFIX)
-from src.scripts.utils import (add_cols_to_metrics_df, add_suffix_to_col,
-                               get_error_log, get_git_sha_for_cassandra,
+                                   NIGHTLY_RESULTS_DIR, PERF_REPORT_JSON_NAME,
+                                   PROSPECTIVE_MODE, SUBSTR_TESTS_NAMES,
+                                   TEST_RUNS_PER_PROCESS_CHUNK,
+                                   TUPLE_SUPPORTED_TESTS, TWO_GIT_SHA_SUFFIX)
+from src.scripts.utils import (add_cols_to_metrics_df, build_stats_index,
+                               find_files_by_name, get_error_log,
+                               get_git_sha_for_cassandra,
                                get_git_sha_for_fallout_tests,
-                               get_relevant_dict, save_df_to_csv)
+                               get_last_row_of_csv, get_numeric_metric,
+                               read_dfs_from_csv, save_dfs_to_csv)
 
+# Matches a date directory (e.g., '2023_01_01')
+DATE_DIR_REGEX = re.compile(DATE_DIR_REGEX_PATTERN)
+# Matches the supported test partitions (e.g., '-fixed-100-') within a type of test
+TEST_PARTITION_REGEX = re.compile(
+    '|'.join(re.escape(substr_test_name) for substr_test_name in SUBSTR_TESTS_NAMES))
+# The test partition (e.g., '-fixed-100-') of each LWT test (e.g., 'lwt-fixed-100-partitions')
+TEST_PARTITION_BY_LWT_TEST = {
+    test_name: TEST_PARTITION_REGEX.search(test_name).group() for test_name in LWT_TESTS_NAMES}
 
-def extract_metrics_df(read_rel_dict: dict, write_rel_dict: dict) -> pd.DataFrame:
+
+def create_hunter_row(read_rel_dict: dict, write_rel_dict: dict) -> dict:
     """
-    Extracts relevant metrics from 2 dictionaries and convert them into a dataframe.
+    Creates one row of values for both read and write with their respective
+    column names from 2 dictionaries, as numeric values (i.e., without units).
 
     Args:
         read_rel_dict: dict
@@ -38,43 +52,17 @@ def extract_metrics_df(read_rel_dict: dict, write_rel_dict: dict) -> pd.DataFram
                     A dictionary of values for write phase.
 
     Returns:
-            Relevant metrics as a dataframe.
+            A dictionary with one row for both read and write values.
     """
 
-    read_write_dict = read_rel_dict, write_rel_dict
-    raw_read_write_df = pd.DataFrame.from_dict(read_write_dict)
-    extracted_col_from_raw_df = raw_read_write_df[LIST_OF_COLS_TO_EXTRACT]
-
-    extracted_col_from_raw_df = extracted_col_from_raw_df.rename(
-        columns=DICT_OF_RENAMED_COLS)
-    return extracted_col_from_raw_df
-
-
-def create_hunter_df(combined_columns_df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Creates a dataframe with only one row of values for both read and
-    write with their respective column names.
-
-    Args:
-        combined_columns_df: pd.DataFrame
-                    A dataframe pertaining to the read and write rows.
-
-    Returns:
-            A dataframe with one row for both read and write values.
-    """
-
-    read_row = pd.DataFrame(combined_columns_df.loc[0]).T
-    write_row = pd.DataFrame(combined_columns_df.loc[1]).T
-
-    read_row = add_suffix_to_col(read_row, '.read')
-    write_row = add_suffix_to_col(write_row, '.write')
-
-    horiz_concat_df_two_rows = pd.concat([read_row, write_row], axis=0)
-    horiz_concat_df_one_blended_row = pd.DataFrame(
-        horiz_concat_df_two_rows.loc[0].combine_first(
-            horiz_concat_df_two_rows.loc[1])
-    ).T
-    return horiz_concat_df_one_blended_row
+    # Only the metrics of interest (renamed, suffixed with their phase and
+    # converted to numbers) are put into the row, which is built directly
+    # rather than via intermediate dataframes
+    return {
+        f'{DICT_OF_RENAMED_COLS[col_name]}.{phase}': get_numeric_metric(rel_dict.get(col_name))
+        for phase, rel_dict in (('read', read_rel_dict), ('write', write_rel_dict))
+        for col_name in LIST_OF_COLS_TO_EXTRACT
+    }
 
 
 def get_paths_to_json(path_w_spec_date: str) -> List[List[str]]:
@@ -90,19 +78,26 @@ def get_paths_to_json(path_w_spec_date: str) -> List[List[str]]:
             A list of paths (List[str]) to the json files of interest.
     """
 
-    # Gets a list of lists of performance-report.json filename for each LWT tests on that given date
-    paths_to_each_json = []
-    for lwt_test in LWT_TESTS_NAMES:
-        each_json_paths_list = glob.glob(
-            f"{path_w_spec_date}{os.sep}{lwt_test}{os.sep}{'**/performance-report.json'}",
-            recursive=True
-        )
-        paths_to_each_json.append(each_json_paths_list)
-
-    return paths_to_each_json
-
-
-def generate_hunter_df(json_paths: List[str]) -> pd.DataFrame:
+    # Gets a list of lists of performance-report.json filename for each LWT tests on that
+    # given date, by walking the date's directory once and dispatching each json to the
+    # LWT test directory it was found under
+    paths_to_each_json = {lwt_test: [] for lwt_test in LWT_TESTS_NAMES}
+    if os.path.isdir(path_w_spec_date):
+        with os.scandir(path_w_spec_date) as date_dir_entries:
+            for date_dir_entry in date_dir_entries:
+                if date_dir_entry.name in paths_to_each_json \
+                        and date_dir_entry.is_dir(follow_symlinks=False):
+                    paths_to_each_json[date_dir_entry.name] = find_files_by_name(
+                        date_dir_entry.path, PERF_REPORT_JSON_NAME)
+
+    return [paths_to_each_json[lwt_test] for lwt_test in LWT_TESTS_NAMES]
+
+
+def generate_hunter_df(
+        json_paths: List[str],
+        cassandra_git_short_hash: str,
+        fallout_tests_git_short_hash: str
+) -> pd.DataFrame:
     """
     Generate the dataframe of test type-specific performance results and the
     corresponding csv file to be fed to hunter.
@@ -110,6 +105,10 @@ def generate_hunter_df(json_paths: List[str]) -> pd.DataFrame:
     Args:
         json_paths: List[str]
                     A list of json paths with performance results and related metrics.
+        cassandra_git_short_hash: str
+                    The Git sha of the Cassandra repo for the date of the test run.
+        fallout_tests_git_short_hash: str
+                    The Git sha of the fallout-tests repo for the date of the test run.
 
     Returns:
             A dataframe of test type-specific performance results.
@@ -122,47 +121,51 @@ def generate_hunter_df(json_paths: List[str]) -> pd.DataFrame:
         )
         return pd.DataFrame()
 
-    # Access performance-report.json
-    with open(json_paths[0]) as json_file:
-        data = json.load(json_file)
+    # A single stat, rather than opening and parsing the file, is enough to skip an empty report
+    if os.stat(json_paths[0]).st_size == 0:
+        logging.error(
+            "The json file '%s' is empty; thus, an empty dataframe is being returned.",
+            json_paths[0]
+        )
+        return pd.DataFrame()
+
+    # Stream performance-report.json, only keeping the successful test runs of
+    # its 'stats' list rather than loading the whole json document in memory;
+    # the raw bytes are read in large chunks and decoded by ijson's C backend
+    with open(json_paths[0], 'rb', buffering=JSON_READ_BUFFER_SIZE) as json_file:
+        data = {'stats': [
+            stats_item for stats_item in ijson.items(
+                json_file, 'stats.item', buf_size=JSON_READ_BUFFER_SIZE, use_float=True)
+            if 'result-success' in stats_item['test']
+        ]}
         if len(data['stats']) == 0:
             logging.error(
-                "The 'stats' list in the 'data' dictionary is empty; "
+                "The 'stats' list in the 'data' dictionary has no successful test runs; "
                 "please ensure that the test has output the statistics into it."
             )
             return pd.DataFrame()
 
-        # Get only read/write-result-success dictionaries.
-        read_dict = get_relevant_dict(data, 'read')
-        write_dict = get_relevant_dict(data, 'write')
-        # Get dataframe with relevant read/write column names, rename
-        # columns to shorten their names.
-        raw_hunter_metrics_df = extract_metrics_df(read_dict, write_dict)
-        raw_hunter_metrics_df['opRate'] = raw_hunter_metrics_df['opRate'].str.rstrip(
-            ' op/sec')
-        for col_name in raw_hunter_metrics_df.columns:
-            if col_name not in ['totalOps', 'opRate']:
-                raw_hunter_metrics_df[col_name] = raw_hunter_metrics_df[col_name].str.rstrip(
-                    ' ms')
+        # Get only read/write-result-success dictionaries
+        # (indexed by test phase in a single pass over the 'stats' list).
+        stats_index = build_stats_index(data)
+        read_dict = stats_index['read']
+        write_dict = stats_index['write']
+        # Get dataframe with relevant read/write column names, renamed
+        # to shorten their names, within a single row.
+        combined_read_write_df = pd.DataFrame([create_hunter_row(read_dict, write_dict)])
         # Get date from the json path (regardless of its positional index)
         # and add time for compatibility with hunter.
+        # The path is scanned from its end, stopping at the last date-like item
         list_of_items_from_json_path = json_paths[0].split(os.sep)
-
-        date_val = ''
-        for item_in_json in list_of_items_from_json_path:
-            matched_pattern = re.search(DATE_DIR_REGEX_PATTERN, item_in_json)
-            if matched_pattern:
-                date_val = matched_pattern.group()
+        date_val = next(
+            (matched_pattern.group() for item_in_json in reversed(list_of_items_from_json_path)
+             if (matched_pattern := DATE_DIR_REGEX.search(item_in_json))),
+            ''
+        )
 
         # As at 11pm UTC
         date_val_w_time = f"{date_val.replace('_', '-')}{' '}{LWT_TEST_RUN_EXEC_TIME}{' +0000'}"
 
-        # Get the Git shas for the Cassandra and fallout-tests repos for auditability
-        cassandra_git_short_hash = get_git_sha_for_cassandra(date_val)
-        fallout_tests_git_short_hash = get_git_sha_for_fallout_tests(date_val)
-
-        combined_read_write_df = create_hunter_df(raw_hunter_metrics_df)
-
         hunter_df_full = add_cols_to_metrics_df(
             date_val_w_time,
             cassandra_git_short_hash,
@@ -172,7 +175,11 @@ def generate_hunter_df(json_paths: List[str]) -> pd.DataFrame:
         return hunter_df_full
 
 
-def get_hunter_df_w_test_type(json_paths: List[str]) -> Tuple[pd.DataFrame, str]:
+def get_hunter_df_w_test_type(
+        json_paths: List[str],
+        cassandra_git_short_hash: str,
+        fallout_tests_git_short_hash: str
+) -> Tuple[pd.DataFrame, str]:
     """
     Get the dataframe to feed to hunter with performance results and
     the corresponding test type (e.g., 100/1000/10000
@@ -181,25 +188,41 @@ def get_hunter_df_w_test_type(json_paths: List[str]) -> Tuple[pd.DataFrame, str]
     Args:
         json_paths: List[str]
                     A list of json paths with performance results and related metrics.
+        cassandra_git_short_hash: str
+                    The Git sha of the Cassandra repo for the date of the test run.
+        fallout_tests_git_short_hash: str
+                    The Git sha of the fallout-tests repo for the date of the test run.
 
     Returns:
             A tuple with the dataframe with performance results and the corresponding test type.
     """
-    hunter_df_out = generate_hunter_df(json_paths)
+    # Tests without any run (e.g., on a given date) are common, hence returned
+    # early rather than going through generate_hunter_df
+    if not json_paths:
+        logging.error(
+            "The 'json_paths' is empty; "
+            "thus, empty dataframe and string are being returned."
+        )
+        return pd.DataFrame(), ''
+
+    hunter_df_out = generate_hunter_df(
+        json_paths, cassandra_git_short_hash, fallout_tests_git_short_hash)
 
-    if len(json_paths) == 0 or hunter_df_out.empty:
+    if hunter_df_out.empty:
         logging.error(
-            "Either the 'json_paths' or the hunter dataframe is empty; "
+            "The hunter dataframe is empty; "
             "thus, empty dataframe and string are being returned."
         )
         return pd.DataFrame(), ''
 
     # Get the test type based on a tuple of supported tests (regardless of their positional index)
+    # (the path is scanned from its end, stopping at the last supported test item)
     list_of_items_from_json_path = json_paths[0].split(os.sep)
-    test_type_str = ''
-    for item_in_json in list_of_items_from_json_path:
-        if item_in_json.startswith(TUPLE_SUPPORTED_TESTS):
-            test_type_str = item_in_json
+    test_type_str = next(
+        (item_in_json for item_in_json in reversed(list_of_items_from_json_path)
+         if item_in_json.startswith(TUPLE_SUPPORTED_TESTS)),
+        ''
+    )
 
     if test_type_str != '' and not hunter_df_out.empty:
         return hunter_df_out, test_type_str
@@ -207,25 +230,24 @@ def get_hunter_df_w_test_type(json_paths: List[str]) -> Tuple[pd.DataFrame, str]
 
 if __name__ == '__main__':
     # Get sorted list of dates from output folders with performance tests
-    nightly_result_dates = os.listdir(NIGHTLY_RESULTS_DIR)
-    nightly_result_dates.sort()
+    # (any other file in the nightly results directory is ignored)
+    with os.scandir(NIGHTLY_RESULTS_DIR) as nightly_results_entries:
+        nightly_result_dates = sorted(
+            nightly_results_entry.name for nightly_results_entry in nightly_results_entries
+            if nightly_results_entry.is_dir())
 
     # Get path of previous csv files from retrospective
     if PROSPECTIVE_MODE:
         csv_file_paths = []
         for csv_file_name in LIST_OF_CSV_NAMES:
             csv_file_paths.append(
-                f'{HUNTER_CSV_PROJ_DIR}{os.sep}{csv_file_name}{HUNTER_FILE_FMT}')
-        # Read the csv files of retrospective run
-        hunter_df_fixed_100, hunter_df_rated_100, hunter_df_fixed_1000, \
-            hunter_df_rated_1000, hunter_df_fixed_10000, hunter_df_rated_10000 = \
-            (pd.read_csv(csv_file_path) for csv_file_path in csv_file_paths)
-
+                os.path.join(HUNTER_CSV_PROJ_DIR, f'{csv_file_name}{HUNTER_FILE_FMT}'))
         # Get date from the latest test run
         test_input_date = nightly_result_dates[-1]
 
-        # Separated by _ to be compared wrt 'test_input_date'
-        last_date_from_csv = hunter_df_fixed_100['time'].iloc[-1].split(' ')[
+        # Separated by _ to be compared wrt 'test_input_date'; only the last row of
+        # the first csv file is read, so that no csv file is loaded if already up to date
+        last_date_from_csv = get_last_row_of_csv(csv_file_paths[0])['time'].split(' ')[
             0].replace('-', '_')
 
         if test_input_date == last_date_from_csv:
@@ -235,116 +257,141 @@ if __name__ == '__main__':
                              f"is not in the csv file and it is "
                              f"past the latest date in the csv file.")
 
+        # Read the csv files of retrospective run (all columns are needed,
+        # as the csv files are rewritten with the latest results appended)
+        hunter_df_fixed_100, hunter_df_rated_100, hunter_df_fixed_1000, \
+            hunter_df_rated_1000, hunter_df_fixed_10000, hunter_df_rated_10000 = \
+            read_dfs_from_csv(csv_file_paths)
+
         # Get path to the latest test run
-        path_w_date = f'{NIGHTLY_RESULTS_DIR}{os.sep}{test_input_date}'
+        path_w_date = os.path.join(NIGHTLY_RESULTS_DIR, test_input_date)
         path_to_each_test_json = get_paths_to_json(path_w_date)
 
+        # Get the Git shas for the Cassandra and fallout-tests repos for auditability,
+        # once for the date rather than for each test run
+        cassandra_git_sha = get_git_sha_for_cassandra(test_input_date)
+        fallout_tests_git_sha = get_git_sha_for_fallout_tests(test_input_date)
+
         list_of_hunter_df = []
         list_of_type_of_tests = []
         for test_json_path in path_to_each_test_json:
-            hunter_df, type_of_test = get_hunter_df_w_test_type(test_json_path)
+            hunter_df, type_of_test = get_hunter_df_w_test_type(
+                test_json_path, cassandra_git_sha, fallout_tests_git_sha)
             if type_of_test != '' and not hunter_df.empty:
                 list_of_hunter_df.append(hunter_df)
                 list_of_type_of_tests.append(type_of_test)
 
-        # Get concatenated hunter dfs across all test types currently supported
-        concat_hunter_data_frames = {
-            SUBSTR_TESTS_NAMES[0]: hunter_df_fixed_100,
-            SUBSTR_TESTS_NAMES[1]: hunter_df_rated_100,
-            SUBSTR_TESTS_NAMES[2]: hunter_df_fixed_1000,
-            SUBSTR_TESTS_NAMES[3]: hunter_df_rated_1000,
-            SUBSTR_TESTS_NAMES[4]: hunter_df_fixed_10000,
-            SUBSTR_TESTS_NAMES[5]: hunter_df_rated_10000
+        # Group the retrospective and latest hunter dfs across all test types currently
+        # supported, so that each test type's dfs are concatenated only once
+        hunter_dfs_per_test_type = {
+            SUBSTR_TESTS_NAMES[0]: [hunter_df_fixed_100],
+            SUBSTR_TESTS_NAMES[1]: [hunter_df_rated_100],
+            SUBSTR_TESTS_NAMES[2]: [hunter_df_fixed_1000],
+            SUBSTR_TESTS_NAMES[3]: [hunter_df_rated_1000],
+            SUBSTR_TESTS_NAMES[4]: [hunter_df_fixed_10000],
+            SUBSTR_TESTS_NAMES[5]: [hunter_df_rated_10000]
         }
 
-        for i, test_type in enumerate(list_of_type_of_tests):
-            for test_partition, hunter_df in concat_hunter_data_frames.items():
-                if test_partition in test_type:
-                    concat_df = pd.concat([hunter_df, list_of_hunter_df[i]])
-                    concat_hunter_data_frames[test_partition] = concat_df
-                    break
+        # Each test type is matched to its partition with the same regex as in retrospective mode
+        for hunter_df, test_type in zip(list_of_hunter_df, list_of_type_of_tests):
+            test_partition_match = TEST_PARTITION_REGEX.search(test_type)
+            if test_partition_match:
+                hunter_dfs_per_test_type[test_partition_match.group()].append(hunter_df)
+            else:
                 get_error_log(test_type)
 
+        # Get concatenated hunter dfs across all test types currently supported
+        concat_hunter_data_frames = {
+            test_partition: pd.concat(hunter_dfs, copy=False, ignore_index=True)
+            for test_partition, hunter_dfs in hunter_dfs_per_test_type.items()
+        }
+
         # Save two versions of the df: 1) with the Cassandra git shas
         # only (for hunter), 2) with two git shas (of the
         # Cassandra and fallout-tests repos) for auditability
-        for i, test_name in enumerate(LWT_TESTS_NAMES):
-            for substr_test_name in SUBSTR_TESTS_NAMES:
-                if substr_test_name in test_name:
-                    df_w_two_git_sha = concat_hunter_data_frames[substr_test_name]
-                    save_df_to_csv(
-                        df_w_two_git_sha,
-                        f'{HUNTER_CSV_PROJ_DIR}{os.sep}{HUNTER_PREFIX}'
-                        f'{test_name}{TWO_GIT_SHA_SUFFIX}{HUNTER_FILE_FMT}'
-                    )
-                    df_w_one_git_sha = df_w_two_git_sha.drop(
-                        FALLOUT_TESTS_COL_NAME, axis=1)
-                    save_df_to_csv(
-                        df_w_one_git_sha,
-                        f'{HUNTER_CSV_PROJ_DIR}{os.sep}'
-                        f'{HUNTER_PREFIX}{test_name}{HUNTER_FILE_FMT}'
-                    )
+        hunter_dfs_w_csv_paths = []
+        for test_name in LWT_TESTS_NAMES:
+            df_w_two_git_sha = concat_hunter_data_frames[TEST_PARTITION_BY_LWT_TEST[test_name]]
+            hunter_dfs_w_csv_paths.append((
+                df_w_two_git_sha,
+                os.path.join(HUNTER_CSV_PROJ_DIR, f'{HUNTER_PREFIX}'
+                             f'{test_name}{TWO_GIT_SHA_SUFFIX}{HUNTER_FILE_FMT}')
+            ))
+            df_w_one_git_sha = df_w_two_git_sha.drop(
+                FALLOUT_TESTS_COL_NAME, axis=1)
+            hunter_dfs_w_csv_paths.append((
+                df_w_one_git_sha,
+                os.path.join(HUNTER_CSV_PROJ_DIR,
+                             f'{HUNTER_PREFIX}{test_name}{HUNTER_FILE_FMT}')
+            ))
+        # The csv files are independent of each other, hence saved concurrently
+        save_dfs_to_csv(hunter_dfs_w_csv_paths)
 
     else:
-        hunter_df_100_fixed, hunter_df_100_rated, hunter_df_1000_fixed, \
-            hunter_df_1000_rated, hunter_df_10000_fixed, \
-            hunter_df_10000_rated, types_of_tests = [], [], [], [], [], [], []
+        hunter_dfs_per_test_type = {
+            substr_test_name: [] for substr_test_name in SUBSTR_TESTS_NAMES}
+        all_test_json_paths = []
+        all_cassandra_git_shas = []
+        all_fallout_tests_git_shas = []
         for input_date in nightly_result_dates:
-            for test_json_path in get_paths_to_json(f'{NIGHTLY_RESULTS_DIR}{os.sep}{input_date}'):
-                hunter_df, type_of_test = get_hunter_df_w_test_type(
-                    test_json_path)
-                if type_of_test:
-                    types_of_tests.append(type_of_test)
-                if SUBSTR_TESTS_NAMES[0] in type_of_test and not hunter_df.empty:
-                    hunter_df_100_fixed.append(hunter_df)
-                elif SUBSTR_TESTS_NAMES[1] in type_of_test and not hunter_df.empty:
-                    hunter_df_100_rated.append(hunter_df)
-                elif SUBSTR_TESTS_NAMES[2] in type_of_test and not hunter_df.empty:
-                    hunter_df_1000_fixed.append(hunter_df)
-                elif SUBSTR_TESTS_NAMES[3] in type_of_test and not hunter_df.empty:
-                    hunter_df_1000_rated.append(hunter_df)
-                elif SUBSTR_TESTS_NAMES[4] in type_of_test and not hunter_df.empty:
-                    hunter_df_10000_fixed.append(hunter_df)
-                elif SUBSTR_TESTS_NAMES[5] in type_of_test and not hunter_df.empty:
-                    hunter_df_10000_rated.append(hunter_df)
-                else:
-                    get_error_log(type_of_test)
-
-        # Create a list of lists of dfs from 6 lists of dfs
-        hunter_dfs = [hunter_df_100_fixed, hunter_df_100_rated,
-                      hunter_df_1000_fixed, hunter_df_1000_rated,
-                      hunter_df_10000_fixed, hunter_df_10000_rated]
-
-        # Create a concatenated df from the above list of lists of
-        # dfs and extracts it into 6 different dfs
-        for i, hunter_df in enumerate(hunter_dfs):
-            hunter_dfs[i] = pd.concat(hunter_df)
-        hunter_df_100_fixed, hunter_df_100_rated, \
-            hunter_df_1000_fixed, hunter_df_1000_rated, \
-            hunter_df_10000_fixed, hunter_df_10000_rated = hunter_dfs
+            paths_to_each_test_json = get_paths_to_json(
+                os.path.join(NIGHTLY_RESULTS_DIR, input_date))
+            # Get the Git shas for the Cassandra and fallout-tests repos for auditability,
+            # once per date (with any test run) rather than for each test run
+            cassandra_git_sha, fallout_tests_git_sha = \
+                (get_git_sha_for_cassandra(input_date), get_git_sha_for_fallout_tests(input_date)) \
+                if any(paths_to_each_test_json) else ('', '')
+            all_test_json_paths.extend(paths_to_each_test_json)
+            all_cassandra_git_shas.extend([cassandra_git_sha] * len(paths_to_each_test_json))
+            all_fallout_tests_git_shas.extend(
+                [fallout_tests_git_sha] * len(paths_to_each_test_json))
+        # Each test run's json is processed independently, hence across all CPUs
+        # (results are returned in the same order as the json paths)
+        with ProcessPoolExecutor() as executor:
+            hunter_dfs_w_types_of_tests = list(executor.map(
+                get_hunter_df_w_test_type,
+                all_test_json_paths,
+                all_cassandra_git_shas,
+                all_fallout_tests_git_shas,
+                chunksize=TEST_RUNS_PER_PROCESS_CHUNK
+            ))
+
+        types_of_tests = []
+        for hunter_df, type_of_test in hunter_dfs_w_types_of_tests:
+            if type_of_test:
+                types_of_tests.append(type_of_test)
+            test_partition_match = TEST_PARTITION_REGEX.search(type_of_test)
+            if test_partition_match and not hunter_df.empty:
+                hunter_dfs_per_test_type[test_partition_match.group()].append(hunter_df)
+            else:
+                get_error_log(type_of_test)
+
+        # Create a concatenated df for each test type with results
+        subset_names_w_dfs = {
+            test_partition: pd.concat(hunter_dfs, copy=False, ignore_index=True)
+            for test_partition, hunter_dfs in hunter_dfs_per_test_type.items() if hunter_dfs
+        }
 
         # Save two versions of the df: 1) with the Cassandra git shas
         # only (for hunter), 2) with two git shas (of the
         # Cassandra and fallout-tests repos) for auditability
-        unique_types_of_tests = pd.Series(types_of_tests).unique()
-        subset_names_w_dfs = {
-            SUBSTR_TESTS_NAMES[0]: hunter_df_100_fixed,
-            SUBSTR_TESTS_NAMES[1]: hunter_df_100_rated,
-            SUBSTR_TESTS_NAMES[2]: hunter_df_1000_fixed,
-            SUBSTR_TESTS_NAMES[3]: hunter_df_1000_rated,
-            SUBSTR_TESTS_NAMES[4]: hunter_df_10000_fixed,
-            SUBSTR_TESTS_NAMES[5]: hunter_df_10000_rated
-        }
-
-        for i, unique_test_type in enumerate(unique_types_of_tests):
-            for subset_names, hunter_df in subset_names_w_dfs.items():
-                if subset_names in unique_test_type:
-                    hunter_file_name = f'{HUNTER_PREFIX}{unique_test_type}'
-                    df = subset_names_w_dfs[subset_names]
-                    save_df_to_csv(df,
-                                   f'{HUNTER_CSV_PROJ_DIR}{os.sep}'
-                                   f'{hunter_file_name}{TWO_GIT_SHA_SUFFIX}{HUNTER_FILE_FMT}')
-                    df_w_one_git_sha = df.drop(FALLOUT_TESTS_COL_NAME, axis=1)
-                    save_df_to_csv(df_w_one_git_sha,
-                                   f'{HUNTER_CSV_PROJ_DIR}{os.sep}'
-                                   f'{hunter_file_name}{HUNTER_FILE_FMT}')
+        # Deduplicated in order of appearance
+        unique_types_of_tests = list(dict.fromkeys(types_of_tests))
+
+        hunter_dfs_w_csv_paths = []
+        for unique_test_type in unique_types_of_tests:
+            # Only test types of a supported test partition with results are saved
+            test_partition_match = TEST_PARTITION_REGEX.search(unique_test_type)
+            if not test_partition_match or test_partition_match.group() not in subset_names_w_dfs:
+                continue
+            hunter_file_name = f'{HUNTER_PREFIX}{unique_test_type}'
+            df = subset_names_w_dfs[test_partition_match.group()]
+            hunter_dfs_w_csv_paths.append((df,
+                                           os.path.join(HUNTER_CSV_PROJ_DIR, f'{hunter_file_name}'
+                                                        f'{TWO_GIT_SHA_SUFFIX}{HUNTER_FILE_FMT}')))
+            df_w_one_git_sha = df.drop(FALLOUT_TESTS_COL_NAME, axis=1)
+            hunter_dfs_w_csv_paths.append((df_w_one_git_sha,
+                                           os.path.join(HUNTER_CSV_PROJ_DIR,
+                                                        f'{hunter_file_name}{HUNTER_FILE_FMT}')))
+        # The csv files are independent of each other, hence saved concurrently
+        save_dfs_to_csv(hunter_dfs_w_csv_paths)
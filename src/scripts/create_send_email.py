@@ -3,29 +3,27 @@ This is a python file to send email to the Cassandra mailing list
 if hunter detects performance regressions.
 """
 
-import collections
+import contextlib
 import logging
 import os
 import smtplib
 import sys
 from email.message import EmailMessage
-
-from typing import List
+from typing import Iterable, Iterator, List
 
 from src.scripts.constants import (HUNTER_CLONE_PROJ_DIR,
+                                   HUNTER_DATE_TO_DIR_DATE,
                                    LIST_OF_HUNTER_RESULTS_JSONS,
-                                   LOG_FILE_W_MSG, NEWLINE_SYMBOL,
-                                   RECEIVER_EMAIL, TEMPLATE_MSG,
+                                   LOG_FILE_W_MSG, RECEIVER_EMAIL,
+                                   TEMPLATE_MSG_FOOTER, TEMPLATE_MSG_HEADER,
                                    THRESH_PERF_REGRESS, TXT_FILE_W_MSG)
 from src.scripts.utils import (get_aws_secrets, get_git_sha_for_cassandra,
                                get_git_sha_for_fallout_tests,
                                get_list_of_dict_from_json)
 
-logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
-
 
 def get_list_of_signif_changes_w_context(
-        hunter_results_list_of_dicts: List[dict[List[dict]]],
+        hunter_results_list_of_dicts: Iterable[dict[List[dict]]],
         threshold: float = THRESH_PERF_REGRESS
 ) -> List[str]:
     """
@@ -33,16 +31,16 @@ def get_list_of_signif_changes_w_context(
     with context.
 
     Args:
-        hunter_results_list_of_dicts: List[dict[List[dict]]]
-                                    A list of dictionaries from hunter results.
+        hunter_results_list_of_dicts: Iterable[dict[List[dict]]]
+                                    An iterable (e.g., a list or a generator) of
+                                    dictionaries from hunter results.
         threshold: float
                 A threshold above or below (+/-) which significant changes are detected.
 
     Returns:
-            A list of significant changes.
+            A sorted list of unique significant changes.
     """
     unique_changes = set()
-    git_shas = {}
 
     for hunter_dict in hunter_results_list_of_dicts:
         if hunter_dict == {}:
@@ -56,44 +54,40 @@ def get_list_of_signif_changes_w_context(
         # detected by hunter
         list_of_time_and_signif_changes = hunter_dict[test_type]
 
-        # Keeps only significant changes beyond +/- % threshold
-        list_of_signif_changes_w_context = [
-            f"For the test '{test_type}' on date and time "
-            f"'{dict_of_time_and_changes['time']}' that ran on "
-            f"cassandra Git commit SHA "
-            f"'{git_shas.get(date[0], get_git_sha_for_cassandra(date[0]))}' "
-            f"and on fallout-tests Git commit SHA "
-            f"'{git_shas.get(date[0], get_git_sha_for_fallout_tests(date[0]))}': "
-            f"The metric '{change['metric']}' changed "
-            f"by {change['forward_change_percent']}%.\n"
-            for dict_of_time_and_changes in list_of_time_and_signif_changes
-            for date in [dict_of_time_and_changes['time'].replace("-", "_").split(' ')]
-            for change in dict_of_time_and_changes['changes']
-            if abs(float(change['forward_change_percent'])) > threshold
-        ]
-
-        unique_changes.update(list_of_signif_changes_w_context)
-
         for dict_of_time_and_changes in list_of_time_and_signif_changes:
-            date = dict_of_time_and_changes['time'].replace(
-                "-", "_").split(' ')
-            git_shas[date[0]] = git_shas.get(
-                date[0], get_git_sha_for_cassandra(date[0]))
-            git_shas[date[0]] = git_shas.get(
-                date[0], get_git_sha_for_fallout_tests(date[0]))
-
-    counter_changes = collections.Counter(unique_changes)
-    dict_counter_changes = dict(counter_changes)
-    list_of_signif_changes = [
-        key for key, val in dict_counter_changes.items() if val == 1]
-
-    return list_of_signif_changes
+            # Keeps only significant changes beyond +/- % threshold
+            signif_changes = [
+                change for change in dict_of_time_and_changes.get('changes') or ()
+                if abs(float(change['forward_change_percent'])) > threshold
+            ]
+            # Skips the Git sha lookups if there is nothing to report for that time
+            if not signif_changes:
+                continue
+
+            time_str = dict_of_time_and_changes['time']
+            # The date (e.g., '2022_01_01') is the first 10 characters of the time
+            date = time_str[:10].translate(HUNTER_DATE_TO_DIR_DATE)
+            # The context is the same for all changes at a given time,
+            # hence it is formatted once for all of them
+            context = (
+                f"For the test '{test_type}' on date and time '{time_str}' that ran on "
+                f"cassandra Git commit SHA '{get_git_sha_for_cassandra(date)}' "
+                f"and on fallout-tests Git commit SHA '{get_git_sha_for_fallout_tests(date)}': "
+            )
+            unique_changes.update(
+                f"{context}The metric '{change['metric']}' changed "
+                f"by {change['forward_change_percent']}%.\n"
+                for change in signif_changes
+            )
+
+    # Sorted (i.e., by test and then date and time) for a deterministic order
+    return sorted(unique_changes)
 
 
 def create_email_w_hunter_regressions(
         new_changes: str,
         output_email_msg_path: str = TXT_FILE_W_MSG
-) -> None:  # pragma: no cover
+) -> str:  # pragma: no cover
     """
     Create email with new performance regressions detected by hunter.
 
@@ -104,13 +98,18 @@ def create_email_w_hunter_regressions(
         output_email_msg_path: str
                             The path with file extension (.txt) to
                             save the txt file of the entire email report.
+
+    Returns:
+            The email body, so that it can be sent without reading the txt file back.
     """
-    # Write email content to txt file
+    # Write email content to txt file (kept for auditability)
     with open(output_email_msg_path, 'w') as text_file:
-        # Insert list of performance regression detected into template msg above
-        data_to_txt_file = TEMPLATE_MSG.replace(
-            '\n\n\n', f'\n\n{new_changes}\n')
-        text_file.writelines(data_to_txt_file)
+        # Insert list of performance regression detected between the
+        # pre-split header and footer of the template msg
+        data_to_txt_file = f'{TEMPLATE_MSG_HEADER}\n\n{new_changes}\n{TEMPLATE_MSG_FOOTER}'
+        text_file.write(data_to_txt_file)
+
+    return data_to_txt_file
 
 
 def create_file_w_regressions_sent_by_email(
@@ -140,7 +139,11 @@ def create_file_w_regressions_sent_by_email(
         for tracking purposes and to avoid sending it again).
     """
 
-    new_changes = set(signif_changes) - set(initial_lines)
+    # Deduplicated in order (unlike a set difference), so that the same
+    # changes are always appended to the log file and sent in the same order
+    initial_lines_set = set(initial_lines)
+    new_changes = [
+        change for change in dict.fromkeys(signif_changes) if change not in initial_lines_set]
 
     if new_changes:
         with open(output_file, 'a') as file:
@@ -150,15 +153,41 @@ def create_file_w_regressions_sent_by_email(
         return new_changes_str
 
 
-def read_txt_send_email() -> None:  # pragma: no cover
+@contextlib.contextmanager
+def smtp_session() -> Iterator[smtplib.SMTP]:  # pragma: no cover
     """
-    Read message from a txt file with performance regressions
-    detected by hunter and send it as an email.
+    Open a logged-in SMTP session over TLS, so that the TCP, TLS and authentication
+    costs are paid once however many emails are sent within it.
+
+    Yields:
+            A logged-in SMTP session, closed upon exiting the context.
     """
-    with open(TXT_FILE_W_MSG, 'r') as txt_file:
-        # Create a text/plain message
-        msg = EmailMessage()
-        msg.set_content(txt_file.read())
+    secret_creds = get_aws_secrets()
+
+    # Create a session to connect to 'server location' and 'port number',
+    # over TLS from the start (rather than upgrading the connection via STARTTLS);
+    # the session is closed upon exit even if the connection has already dropped
+    with smtplib.SMTP_SSL('smtp.gmail.com', 465) as session:
+        # Authentication
+        # (generate 16-digit pwd via Google acct as per
+        # https://towardsdatascience.com/how-to-easily-automate-emails-with-python-8b476045c151#:~:text=with%20the%2016%2Dcharacter%20password)
+        session.login(secret_creds['username'], secret_creds['password'])
+        yield session
+
+
+def send_email(email_body: str, session: smtplib.SMTP) -> None:  # pragma: no cover
+    """
+    Send an email with performance regressions detected by hunter.
+
+    Args:
+        email_body: str
+                  The body of the email to send.
+        session: smtplib.SMTP
+                A logged-in SMTP session, e.g., from smtp_session().
+    """
+    # Create a text/plain message
+    msg = EmailMessage()
+    msg.set_content(email_body)
 
     keywords_changes = f'The most significant ' \
                        f'(+/- {THRESH_PERF_REGRESS}%) performance '
@@ -171,45 +200,40 @@ def read_txt_send_email() -> None:  # pragma: no cover
     msg['From'] = secret_creds['username']
     msg['To'] = send_to
 
-    # Create a session to connect to 'server location' and 'port number'
-    session = smtplib.SMTP('smtp.gmail.com', 587)
-    # Start TLS for security
-    session.starttls()
-
-    # Authentication and send email
-    # (generate 16-digit pwd via Google acct as per
-    # https://towardsdatascience.com/how-to-easily-automate-emails-with-python-8b476045c151#:~:text=with%20the%2016%2Dcharacter%20password)
-    session.login(secret_creds['username'], secret_creds['password'])
     session.send_message(msg)
 
-    session.quit()
-
 
 def main():  # pragma: no cover
     """
     Get performance regressions detected by hunter and send them via one email
     """
-    new_changes_strings_list = []
-    for hunter_result_name in LIST_OF_HUNTER_RESULTS_JSONS:
-        orig_json_path = f'{HUNTER_CLONE_PROJ_DIR}{os.sep}{hunter_result_name}'
-        hunter_list_of_dict = get_list_of_dict_from_json(orig_json_path)
-        list_of_signif_changes_w_context = get_list_of_signif_changes_w_context(
-            hunter_list_of_dict)
-        with open(LOG_FILE_W_MSG, 'r') as log_txt_file:
-            initial_log_lines = log_txt_file.readlines()
-        new_changes_str = create_file_w_regressions_sent_by_email(
-            list_of_signif_changes_w_context,
-            initial_log_lines
-        )
-        if new_changes_str:
-            new_changes_strings_list.append(new_changes_str)
+    # INFO rather than DEBUG, to avoid third-party libraries (e.g., boto3)
+    # flooding stdout with debug messages
+    logging.basicConfig(stream=sys.stdout, level=logging.INFO)
+
+    # The log file of changes already sent is read once, and the changes
+    # detected across all hunter results are then appended to it at once
+    with open(LOG_FILE_W_MSG, 'r') as log_txt_file:
+        initial_log_lines = log_txt_file.readlines()
+
+    hunter_list_of_dict = (
+        hunter_dict
+        for hunter_result_name in LIST_OF_HUNTER_RESULTS_JSONS
+        for hunter_dict in get_list_of_dict_from_json(
+            os.path.join(HUNTER_CLONE_PROJ_DIR, hunter_result_name))
+    )
+    list_of_signif_changes_w_context = get_list_of_signif_changes_w_context(
+        hunter_list_of_dict)
+    new_changes_str = create_file_w_regressions_sent_by_email(
+        list_of_signif_changes_w_context,
+        initial_log_lines
+    )
 
     # Only create and send an email if there were any new changes detected
-    new_changes_str_concat = ''.join(
-        new_changes_strings_list).lstrip(NEWLINE_SYMBOL)
-    if new_changes_str_concat:
-        create_email_w_hunter_regressions(new_changes_str_concat)
-        read_txt_send_email()
+    if new_changes_str:
+        email_body = create_email_w_hunter_regressions(new_changes_str)
+        with smtp_session() as session:
+            send_email(email_body, session)
 
 
 if __name__ == '__main__':
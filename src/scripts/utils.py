@@ -3,21 +3,29 @@ This Python file hosts utility-based functions used to support the
 creation of a csv for Hunter.
 """
 
+import csv
+import functools
 import glob
 import json
 import logging
 import os
-from typing import List
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple, Union
 
-import boto3
+import orjson
 import pandas as pd
-from botocore.exceptions import ClientError
 
-from src.scripts.constants import (CASSANDRA_COL_NAME, FALLOUT_TESTS_COL_NAME,
-                                   FALLOUT_TESTS_SHA_PROJ_DIR, LWT_TESTS_NAMES,
+from src.scripts.constants import (CASSANDRA_COL_NAME, COMMIT_COLS_DTYPES,
+                                   CSV_IO_MAX_WORKERS, FALLOUT_TESTS_COL_NAME,
+                                   FALLOUT_TESTS_SHA_PROJ_DIR,
+                                   JSON_READ_BUFFER_SIZE,
+                                   METRIC_UNITS_REGEX_PATTERN, NEWLINE_BYTES,
                                    NEWLINE_SYMBOL, NIGHTLY_RESULTS_DIR,
                                    REGION_NAME, SECRET_NAME)
 
+METRIC_UNITS_REGEX = re.compile(METRIC_UNITS_REGEX_PATTERN)
+
 
 def add_cols_to_metrics_df(
         date_time: str,
@@ -43,38 +51,61 @@ def add_cols_to_metrics_df(
             A dataframe of the original metrics with time and commit columns added
     """
 
-    combined_columns_df = extract_col_from_raw_df.copy()
-    combined_columns_df['time'] = date_time
-    combined_columns_df[CASSANDRA_COL_NAME] = cassandra_commit
-    combined_columns_df[FALLOUT_TESTS_COL_NAME] = fallout_tests_commit
-    return combined_columns_df
+    # A single assign (rather than a deep copy followed by one insertion per column)
+    return extract_col_from_raw_df.assign(**{
+        'time': date_time,
+        CASSANDRA_COL_NAME: cassandra_commit,
+        FALLOUT_TESTS_COL_NAME: fallout_tests_commit
+    })
 
 
-def add_suffix_to_col(phase_df: pd.DataFrame, phase: str) -> pd.DataFrame:
+def find_files_by_name(root_dir: str, file_name: str) -> List[str]:
     """
-    Appends appropriate suffix, i.e., '.read' or '.write', to each column name.
+    Find all files with a given name under a root directory (and its subdirectories)
+    by visiting each directory entry only once via os.scandir.
+    As with glob.glob(f'{root_dir}/**/{file_name}', recursive=True), directories are
+    visited in pre-order, hidden directories are skipped and symlinked ones followed.
 
     Args:
-        phase_df: pd.DataFrame
-                    A phase-related dataframe.
-        phase: str
-            The phase of interest, i.e., 'read' or 'write'.
+        root_dir: str
+                The directory from which to start searching.
+        file_name: str
+                The exact name of the files to find.
 
     Returns:
-            A dataframe with columns appended with the appropriate suffix.
+            A list of paths (List[str]) to the files found (if any).
     """
-
-    new_cols = []
-    for col in phase_df.columns:
-        new_cols.append(col + phase)
-
-    phase_df.columns = new_cols
-    return phase_df
-
-
+    if not os.path.isdir(root_dir):
+        return []
+
+    found_file_paths = []
+    dirs_to_visit = [root_dir]
+    while dirs_to_visit:
+        sub_dirs = []
+        try:
+            with os.scandir(dirs_to_visit.pop()) as dir_entries:
+                for dir_entry in dir_entries:
+                    # The entry type is cached by os.scandir, hence no extra stat call
+                    # (unless the entry is a symlink)
+                    if dir_entry.is_dir():
+                        if not dir_entry.name.startswith('.'):
+                            sub_dirs.append(dir_entry.path)
+                    elif dir_entry.name == file_name:
+                        found_file_paths.append(dir_entry.path)
+        except OSError:
+            # Unreadable directories are skipped, as by glob
+            continue
+        # Pushed in reverse, so that subdirectories are popped (i.e., visited) in the
+        # os.scandir order, which the order of the paths found (and json_paths[0]) relies on
+        dirs_to_visit.extend(reversed(sub_dirs))
+    return found_file_paths
+
+
+@functools.lru_cache(maxsize=256)
 def get_git_sha_for_cassandra(input_date: str) -> str:  # pragma: no cover
     """
     Get the Git sha of the Cassandra repo for a given date from a logs.txt file.
+    Results are cached per date, as the same date is often looked up repeatedly.
 
     Args:
         input_date: str
@@ -84,39 +115,38 @@ def get_git_sha_for_cassandra(input_date: str) -> str:  # pragma: no cover
             The Git sha (str) of the Cassandra repo for a given date.
     """
 
-    log_files_list = []
-    list_of_log_file_path = []
-    for _ in LWT_TESTS_NAMES:
-        log_files_list = glob.glob(
-            f"{NIGHTLY_RESULTS_DIR}{os.sep}{input_date}{os.sep}"
-            f"{'**/performance-tester-dc1-default-sts-0/logs.txt'}",
-            recursive=True
-        )
-        for log_file_path in log_files_list:
-            list_of_log_file_path.append(log_file_path)
-
-    git_sha_list = []
-    for logs in log_files_list:
-        with open(logs, 'r') as text:
-            content = ' '.join(text.readlines())
-            git_sha = content.split('Git SHA: ')[1].split(NEWLINE_SYMBOL)[0]
-            git_sha_list.append(git_sha)
+    # The log files of all tests of the date are found by a single recursive glob
+    log_files_list = glob.glob(
+        os.path.join(NIGHTLY_RESULTS_DIR, input_date, '**',
+                     'performance-tester-dc1-default-sts-0', 'logs.txt'),
+        recursive=True
+    )
 
     # Get the first non-empty Git sha as the final one, as at
     # times one subtest may not yield results, whilst
-    # another one (or all others) may.
-    final_cass_sha = ''
-    for _, git_sha_elem in enumerate(git_sha_list):
-        if git_sha_elem != '':
-            final_cass_sha = git_sha_elem
-            break
-    return final_cass_sha
-
-
+    # another one (or all others) may; hence, the remaining
+    # log files are not read once a Git sha is found.
+    git_sha_prefix = 'Git SHA: '
+    for logs in log_files_list:
+        with open(logs, 'r') as text:
+            content = text.read()
+        git_sha_idx = content.find(git_sha_prefix)
+        if git_sha_idx == -1:
+            continue
+        git_sha_start = git_sha_idx + len(git_sha_prefix)
+        git_sha_end = content.find(NEWLINE_SYMBOL, git_sha_start)
+        git_sha = content[git_sha_start:git_sha_end if git_sha_end != -1 else len(content)]
+        if git_sha != '':
+            return git_sha
+    return ''
+
+
+@functools.lru_cache(maxsize=256)
 def get_git_sha_for_fallout_tests(input_date: str) -> str:  # pragma: no cover
     """
     Get the Git sha of the fallout-tests repo for a given
     date from a fallout-tests_git_sha.log file.
+    Results are cached per date, as the same date is often looked up repeatedly.
 
     Args:
         input_date: str
@@ -126,19 +156,20 @@ def get_git_sha_for_fallout_tests(input_date: str) -> str:  # pragma: no cover
             The Git sha (str) of the fallout-tests repo for a given date.
     """
 
-    fallout_tests_log_file_list = glob.glob(
-        f"{FALLOUT_TESTS_SHA_PROJ_DIR}{os.sep}{input_date}{os.sep}{'fallout-tests_git_sha.log'}",
+    # Only the first matching log file is needed, hence the glob stops there
+    fallout_tests_log_file = next(glob.iglob(
+        os.path.join(FALLOUT_TESTS_SHA_PROJ_DIR, input_date, 'fallout-tests_git_sha.log'),
         recursive=True
-    )
+    ), None)
 
-    if len(fallout_tests_log_file_list) == 0:
+    if fallout_tests_log_file is None:
         logging.error(
-            "The 'fallout_tests_log_file_list' is empty; "
+            "The 'fallout_tests_log_file' is missing; "
             "thus, an empty string (instead of the fallout-tests Git sha) is being returned."
         )
         return ''
 
-    with open(fallout_tests_log_file_list[0], 'r') as text:
+    with open(fallout_tests_log_file, 'r') as text:
         content = ' '.join(text.readlines())
         # The 1st element is the Git sha, the 2nd is the datetime
         final_fallout_tests_sha = content.split(',', maxsplit=1)[0]
@@ -158,27 +189,62 @@ def get_error_log(test_type: str) -> None:  # pragma: no cover
                   "or 10000.", test_type)
 
 
-def get_relevant_dict(dict_of_dicts: dict, test_phase: str) -> dict:
+def get_numeric_metric(
+        metric_val: Optional[Union[str, int, float]]
+) -> Optional[Union[str, int, float]]:
     """
-    Get the relevant dictionary (e.g., read- or write-related) from
-    a dictionary of dictionaries.
+    Convert a metric value, e.g., '1.23 ms' or '9966 op/sec', into a number
+    by stripping its unit (if any).
+
+    Args:
+        metric_val: Optional[Union[str, int, float]]
+                A metric value, with or without a unit, or None (or NaN)
+                if the metric is missing (e.g., the test phase failed).
+
+    Returns:
+            The metric value as an int or a float, or as a string stripped of
+            its unit if it is not numeric; a missing metric is returned unchanged.
+    """
+    if not isinstance(metric_val, str):
+        return metric_val
+
+    metric_val_wo_unit = METRIC_UNITS_REGEX.sub('', metric_val)
+    for numeric_type in (int, float):
+        try:
+            return numeric_type(metric_val_wo_unit)
+        except ValueError:
+            continue
+    return metric_val_wo_unit
+
+
+def build_stats_index(
+        dict_of_dicts: dict,
+        test_phases: Tuple[str, ...] = ('read', 'write')
+) -> dict:
+    """
+    Build an index of the relevant dictionaries (e.g., read- and write-related)
+    from a dictionary of dictionaries, keyed by test phase, in a single pass.
 
     Args:
         dict_of_dicts: dict
                     A dictionary of dictionaries, each of which hosts
                     the results from a test run (e.g., read or write).
-        test_phase: str
-            The test phase of interest, i.e., 'read' or 'write'.
+        test_phases: Tuple[str, ...]
+            The test phases of interest, e.g., 'read' and 'write'.
 
     Returns:
-            The relevant dictionary.
+            A dictionary of the relevant dictionary of each test phase
+            (the successful test runs of that phase merged in order).
     """
-    relevant_dict = {}
+    stats_index = {test_phase: {} for test_phase in test_phases}
     for dict_test_run in dict_of_dicts['stats']:
-        if 'result-success' in dict_test_run['test']:
-            if test_phase in dict_test_run['test']:
-                relevant_dict.update(dict_test_run)
-    return relevant_dict
+        test_name = dict_test_run['test']
+        if 'result-success' not in test_name:
+            continue
+        for test_phase in test_phases:
+            if test_phase in test_name:
+                stats_index[test_phase].update(dict_test_run)
+    return stats_index
 
 
 def save_df_to_csv(input_df: pd.DataFrame, path_to_output: str) -> None:  # pragma: no cover
@@ -194,13 +260,109 @@ def save_df_to_csv(input_df: pd.DataFrame, path_to_output: str) -> None:  # prag
     input_df.to_csv(path_to_output, index=False)
 
 
+def get_last_line_of_file(file_path: str, block_size: int = 4096) -> bytes:
+    """
+    Get the last non-blank line of a file, by only reading its last blocks
+    (rather than the whole file).
+
+    Args:
+        file_path: str
+                The file path with the file name and extension.
+        block_size: int
+                The size (in bytes) of the blocks read from the end of the file.
+
+    Returns:
+            The last non-blank line (bytes) of the file, or empty bytes if there is none.
+    """
+    with open(file_path, 'rb') as file:
+        file.seek(0, os.SEEK_END)
+        block_start = file.tell()
+        tail = b''
+        # Read blocks backwards until the tail holds the whole last non-blank line
+        while block_start > 0 and NEWLINE_BYTES not in tail.rstrip():
+            read_size = min(block_size, block_start)
+            block_start -= read_size
+            file.seek(block_start)
+            tail = file.read(read_size) + tail
+    return tail.rstrip().rsplit(NEWLINE_BYTES, 1)[-1]
+
+
+def get_last_row_of_csv(csv_path: str, block_size: int = 4096) -> dict:
+    """
+    Get the last row of a csv file, by reading its header and then only its
+    last blocks (rather than the whole file).
+
+    Args:
+        csv_path: str
+                The csv file path with the file name and extension (.csv).
+        block_size: int
+                The size (in bytes) of the blocks read from the end of the file.
+
+    Returns:
+            A dictionary of the last row of the csv file, keyed by its column names.
+    """
+    with open(csv_path, 'rb') as csv_file:
+        header_line = csv_file.readline()
+    last_line = get_last_line_of_file(csv_path, block_size)
+
+    header, last_row = csv.reader([header_line.decode(), last_line.decode()])
+    return dict(zip(header, last_row))
+
+
+def read_dfs_from_csv(paths_to_input: List[str]) -> List[pd.DataFrame]:  # pragma: no cover
+    """
+    Read csv files (e.g., of hunter) into dataframes concurrently, as their parsing
+    by pandas' C engine releases the GIL.
+
+    Args:
+        paths_to_input: List[str]
+                The filenames of the csv files to read.
+
+    Returns:
+            A list of dataframes, in the same order as the input filenames.
+    """
+    with ThreadPoolExecutor(max_workers=CSV_IO_MAX_WORKERS) as executor:
+        return list(executor.map(
+            functools.partial(pd.read_csv, engine='c', dtype=COMMIT_COLS_DTYPES),
+            paths_to_input
+        ))
+
+
+def save_dfs_to_csv(
+        dfs_w_paths_to_output: List[Tuple[pd.DataFrame, str]]
+) -> None:  # pragma: no cover
+    """
+    Save input dataframes to csv files concurrently, as writing them is mostly I/O-bound.
+
+    Args:
+        dfs_w_paths_to_output: List[Tuple[pd.DataFrame, str]]
+                A list of tuples, each of which with an input dataframe and
+                the filename where to save it.
+    """
+    with ThreadPoolExecutor(max_workers=CSV_IO_MAX_WORKERS) as executor:
+        futures = [
+            executor.submit(save_df_to_csv, input_df, path_to_output)
+            for input_df, path_to_output in dfs_w_paths_to_output
+        ]
+        # Propagate any exception raised whilst saving a csv file
+        for future in futures:
+            future.result()
+
+
+@functools.lru_cache(maxsize=1)
 def get_aws_secrets() -> dict:  # pragma: no cover
     """
     Get secrets (username and password) from the AWS Secret Manager.
+    The boto3 session, client and secret are only created/fetched once per process.
 
     Returns:
             A dictionary with AWS secrets.
     """
+    # Imported here as boto3 is slow to import and only needed to send emails
+    # pylint: disable=import-outside-toplevel
+    import boto3
+    from botocore.exceptions import ClientError
+
     secret_name = SECRET_NAME
     region_name = REGION_NAME
 
@@ -234,15 +396,10 @@ def get_list_of_dict_from_json(file_path: str) -> List[dict]:
                 The json file path with the file name and extension (.json).
 
     Returns:
-            A list of dictionaries (one dict for each line in the json file).
-    """
-    hunter_result_list_of_dicts = []
-    with open(file_path, 'r') as json_file:
-        for hunter_result_str in json_file:
-            # Convert each line to a dict
-            hunter_result_dict = json.loads(hunter_result_str)
-            hunter_result_list_of_dicts.append(hunter_result_dict)
-    # Get and return the last dictionary
-    hunter_result_dict = hunter_result_list_of_dicts[-1]
-    hunter_result_list_of_dict = [hunter_result_dict]
-    return hunter_result_list_of_dict
+            A list with the last dictionary in the json file (one dict per line).
+    """
+    # Only the last line of the file is read and parsed (orjson parses bytes
+    # directly), rather than every line of a file that grows with each run
+    hunter_result_str = get_last_line_of_file(file_path, block_size=JSON_READ_BUFFER_SIZE)
+    # Return the last dictionary
+    return [orjson.loads(hunter_result_str) if hunter_result_str else {}]
@@ -0,0 +1,40 @@
+import json
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+
+from src.scripts.constants import LIST_OF_COLS_TO_EXTRACT
+from src.scripts.create_hunter_csv import generate_hunter_df
+
+
+class TestCreateHunterCsv(unittest.TestCase):
+
+    def test_generate_hunter_df_w_failed_read_phase(self):
+        # Create a dummy performance report whose read phase failed but whose write phase succeeded
+        write_metrics = {col_name: '1.5 ms' for col_name in LIST_OF_COLS_TO_EXTRACT}
+        write_metrics.update({'Total Operations': 6007010, 'Op Rate': '9966 op/sec'})
+        dummy_report = {'stats': [
+            {'test': 'failed-read', 'metrics': ['Ops/Sec']},
+            dict({'test': 'result-success-write', 'metrics': ['Ops/Sec']}, **write_metrics),
+        ]}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            report_dir = os.path.join(tmp_dir, '2023_01_01', 'lwt-fixed-100-partitions')
+            os.makedirs(report_dir)
+            report_path = os.path.join(report_dir, 'performance-report.json')
+            with open(report_path, 'w') as f:
+                json.dump(dummy_report, f)
+
+            result_df = generate_hunter_df([report_path], 'abc1', 'def2')
+
+        # One row, with missing read metrics rather than an error
+        self.assertIsInstance(result_df, pd.DataFrame)
+        self.assertEqual(len(result_df), 1)
+        self.assertTrue(result_df['totalOps.read'].isna().all())
+        self.assertTrue(result_df['p99.read'].isna().all())
+        self.assertEqual(result_df.loc[0, 'totalOps.write'], 6007010)
+        self.assertEqual(result_df.loc[0, 'opRate.write'], 9966)
+        self.assertEqual(result_df.loc[0, 'p99.write'], 1.5)
+        self.assertEqual(result_df.loc[0, 'time'], '2023-01-01 23:00:00 +0000')
+        self.assertEqual(result_df.loc[0, 'commit'], 'abc1')
@@ -44,34 +44,27 @@ class TestCreateSendEmail(unittest.TestCase):
         # Set a sample threshold
         threshold = 11
 
-        # Define the expected output
-        expected_output = ["For the test 'lwt-fixed-100-partitions' on date and time '2022-01-01 23:00:00' that "
-                           "ran on cassandra Git commit SHA '' and on fallout-tests Git commit SHA '': "
-                           "The metric 'avgLat' changed by 20%.\n",
-                           "For the test 'lwt-fixed-100-partitions' on date and time '2022-01-01 23:00:00' that "
-                           "ran on cassandra Git commit SHA '' and on fallout-tests Git commit SHA '': "
-                           "The metric 'p99' changed by 30%.\n",
-                           "For the test 'lwt-fixed-100-partitions' on date and time '2022-01-01 23:00:00' that "
-                           "ran on cassandra Git commit SHA '' and on fallout-tests Git commit SHA '': "
-                           "The metric 'opRate' changed by -20%.\n",
-                           "For the test 'lwt-fixed-100-partitions' on date and time '2022-01-01 23:00:00' that "
-                           "ran on cassandra Git commit SHA '' and on fallout-tests Git commit SHA '': "
-                           "The metric 'p95' changed by -25%.\n",
-                           "For the test 'lwt-fixed-100-partitions' on date and time '2022-01-01 23:00:00' that "
-                           "ran on cassandra Git commit SHA '' and on fallout-tests Git commit SHA '': "
-                           "The metric 'maxLat' changed by 50%.\n",
-                           "For the test 'lwt-fixed-100-partitions' on date and time '2022-01-02 23:00:00' that "
-                           "ran on cassandra Git commit SHA '' and on fallout-tests Git commit SHA '': "
-                           "The metric 'p99' changed by 15%.\n",
-                           "For the test 'lwt-fixed-100-partitions' on date and time '2022-01-02 23:00:00' that "
-                           "ran on cassandra Git commit SHA '' and on fallout-tests Git commit SHA '': "
-                           "The metric 'opRate' changed by 15%.\n",
-                           "For the test 'lwt-fixed-100-partitions' on date and time '2022-01-02 23:00:00' that "
-                           "ran on cassandra Git commit SHA '' and on fallout-tests Git commit SHA '': "
-                           "The metric 'p95' changed by 15%.\n",
-                           "For the test 'lwt-fixed-100-partitions' on date and time '2022-01-02 23:00:00' that "
-                           "ran on cassandra Git commit SHA '' and on fallout-tests Git commit SHA '': "
-                           "The metric 'maxLat' changed by 30%.\n"]
+        # Define the expected output: one message per (time, metric, percentage) case
+        expected_msg_template = (
+            "For the test 'lwt-fixed-100-partitions' on date and time '{time}' that "
+            "ran on cassandra Git commit SHA '' and on fallout-tests Git commit SHA '': "
+            "The metric '{metric}' changed by {percent}%.\n"
+        )
+        expected_cases = [
+            ('2022-01-01 23:00:00', 'avgLat', '20'),
+            ('2022-01-01 23:00:00', 'p99', '30'),
+            ('2022-01-01 23:00:00', 'opRate', '-20'),
+            ('2022-01-01 23:00:00', 'p95', '-25'),
+            ('2022-01-01 23:00:00', 'maxLat', '50'),
+            ('2022-01-02 23:00:00', 'p99', '15'),
+            ('2022-01-02 23:00:00', 'opRate', '15'),
+            ('2022-01-02 23:00:00', 'p95', '15'),
+            ('2022-01-02 23:00:00', 'maxLat', '30'),
+        ]
+        expected_output = [
+            expected_msg_template.format(time=time, metric=metric, percent=percent)
+            for time, metric, percent in expected_cases
+        ]
 
         # Call the function and check the output
         result_output = get_list_of_signif_changes_w_context(
@@ -80,6 +73,25 @@ class TestCreateSendEmail(unittest.TestCase):
         self.assertIsInstance(result_output, list)
         self.assertCountEqual(result_output, expected_output)
 
+    def test_get_list_of_signif_changes_w_context_wo_signif_changes(self):
+        # Create a dummy input list of dictionaries without any change beyond the threshold
+        dummy_hunter_results_list_of_dicts = [
+            {'lwt-fixed-100-partitions': [
+                {'time': '2022-01-01 23:00:00', 'changes': [
+                    {'metric': 'totalOps', 'forward_change_percent': '-10'},
+                    {'metric': 'avgLat', 'forward_change_percent': '5'},
+                ]},
+                {'time': '2022-01-02 23:00:00', 'changes': []},
+            ]},
+            {},
+        ]
+
+        result_output = get_list_of_signif_changes_w_context(
+            dummy_hunter_results_list_of_dicts, 11)
+
+        self.assertIsInstance(result_output, list)
+        self.assertEqual(result_output, [])
+
     def test_create_file_w_regressions_sent_by_email(self):
         # Create sample input lists
         list_of_signif_changes_w_context = [
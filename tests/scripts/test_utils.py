@@ -1,72 +1,136 @@
+import glob
+import json
+import math
 import os
+import tempfile
 import unittest
 
-import pandas as pd
-from pandas.testing import assert_frame_equal
-
-from src.scripts.utils import (add_suffix_to_col, get_list_of_dict_from_json,
-                               get_relevant_dict)
+from src.scripts.utils import (build_stats_index, find_files_by_name,
+                               get_last_line_of_file, get_last_row_of_csv,
+                               get_list_of_dict_from_json, get_numeric_metric)
 
 
 class TestUtils(unittest.TestCase):
 
-    def setUp(self):
-        """Create a dummy JSON file for testing"""
-        self.dummy_json_file_path = 'dummy_hunter.json'
-        with open(self.dummy_json_file_path, 'w') as f:
-            f.write('{"test_type": "100-fixed", "changes": 25}\n')
-            f.write('{"test_type": "1000-fixed", "changes": 30}\n')
-            f.write('{"test_type": "10000-fixed", "changes": 35}\n')
-
-    def tearDown(self):
-        """Delete the dummy JSON file after testing"""
-        os.remove(self.dummy_json_file_path)
-
-    def test_add_suffix_to_col(self):
-
-        suffix = '.read'
-        data_for_dummy_df = [[6007010, 9966], [6005190, 9962]]
-        col_names_for_expected_dummy_df = [
-            f'totalOps{suffix}', f'opRate{suffix}']
-        col_names_for_input_dummy_df = ['totalOps', 'opRate']
-        expected_dummy_df = pd.DataFrame(
-            columns=col_names_for_expected_dummy_df,
-            data=data_for_dummy_df
-        )
-
-        input_dummy_df = pd.DataFrame(
-            columns=col_names_for_input_dummy_df,
-            data=data_for_dummy_df
-        )
-
-        result_dummy_df = add_suffix_to_col(input_dummy_df, suffix)
-
-        self.assertIsInstance(result_dummy_df, pd.DataFrame)
-        assert_frame_equal(result_dummy_df, expected_dummy_df)
-
-    def test_get_relevant_dict_w_result_success_and_relevant_phase(self):
-        expected_relevant_dict = {
-            'test': 'result-success-read', 'metrics': ['Ops/Sec'], 'Op Rate': 9966}
-        dummy_dict_of_dicts = {'stats': [expected_relevant_dict]}
-        result_relevant_dict = get_relevant_dict(dummy_dict_of_dicts, 'read')
-        self.assertIsInstance(result_relevant_dict, dict)
-        self.assertEqual(result_relevant_dict, expected_relevant_dict)
-
-    def test_get_relevant_dict_w_result_success_but_no_relevant_phase(self):
-        expected_relevant_dict = {}
-        dummy_dict_of_dicts = {'stats': [
-            {'test': 'result-success-create-ks', 'metrics': ['Ops/Sec'], 'Op Rate': 0}]}
-        result_relevant_dict = get_relevant_dict(dummy_dict_of_dicts, 'read')
-        self.assertIsInstance(result_relevant_dict, dict)
-        self.assertEqual(result_relevant_dict, expected_relevant_dict)
-
-    def test_get_relevant_dict_wo_result_success(self):
-        expected_relevant_dict = {}
-        dummy_dict_of_dicts = {
-            'stats': [{'test': 'failed-read', 'metrics': ['Ops/Sec'], 'Op Rate': 8700}]}
-        result_relevant_dict = get_relevant_dict(dummy_dict_of_dicts, 'read')
-        self.assertIsInstance(result_relevant_dict, dict)
-        self.assertEqual(result_relevant_dict, expected_relevant_dict)
+    @classmethod
+    def setUpClass(cls):
+        """Create a dummy JSON file (one dict per line) once, in a temporary directory, for testing"""
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        cls.dummy_json_file_path = os.path.join(cls.tmp_dir.name, 'dummy_hunter.json')
+        dummy_hunter_results = [
+            {'test_type': '100-fixed', 'changes': 25},
+            {'test_type': '1000-fixed', 'changes': 30},
+            {'test_type': '10000-fixed', 'changes': 35},
+        ]
+        with open(cls.dummy_json_file_path, 'w') as f:
+            f.write(''.join(f'{json.dumps(hunter_result)}\n' for hunter_result in dummy_hunter_results))
+
+    @classmethod
+    def tearDownClass(cls):
+        """Delete the temporary directory (and the dummy JSON file) after testing"""
+        cls.tmp_dir.cleanup()
+
+    def test_build_stats_index(self):
+        read_dict = {'test': 'result-success-read', 'metrics': ['Ops/Sec'], 'Op Rate': 9966}
+        write_dict = {'test': 'result-success-write', 'metrics': ['Ops/Sec'], 'Op Rate': 9962}
+        # (case, dummy test runs, expected stats index)
+        cases = [
+            ('w_both_phases', [
+                {'test': 'result-success-create-ks', 'metrics': ['Ops/Sec'], 'Op Rate': 0},
+                read_dict,
+                {'test': 'failed-write', 'metrics': ['Ops/Sec'], 'Op Rate': 8700},
+                write_dict,
+            ], {'read': read_dict, 'write': write_dict}),
+            ('wo_result_success_for_read', [
+                {'test': 'failed-read', 'metrics': ['Ops/Sec'], 'Op Rate': 8700},
+                write_dict,
+            ], {'read': {}, 'write': write_dict}),
+        ]
+        for case, dummy_test_runs, expected_stats_index in cases:
+            with self.subTest(case=case):
+                result_stats_index = build_stats_index({'stats': dummy_test_runs})
+                self.assertIsInstance(result_stats_index, dict)
+                self.assertEqual(result_stats_index, expected_stats_index)
+
+    def test_find_files_by_name(self):
+        with tempfile.TemporaryDirectory() as root_dir:
+            # Create a nested directory tree with two matching files and one non-matching file
+            nested_dir = os.path.join(root_dir, 'lwt-fixed-100-partitions', 'run', 'artifacts')
+            os.makedirs(nested_dir)
+            expected_paths = [
+                os.path.join(root_dir, 'lwt-fixed-100-partitions', 'performance-report.json'),
+                os.path.join(nested_dir, 'performance-report.json'),
+            ]
+            for file_path in expected_paths + [os.path.join(nested_dir, 'logs.txt')]:
+                with open(file_path, 'w') as f:
+                    f.write('')
+
+            result_paths = find_files_by_name(root_dir, 'performance-report.json')
+
+        self.assertIsInstance(result_paths, list)
+        self.assertCountEqual(result_paths, expected_paths)
+
+    def test_find_files_by_name_in_glob_order(self):
+        with tempfile.TemporaryDirectory() as root_dir:
+            # Create several test runs (nested at different depths), and one hidden directory
+            for sub_dir in ['b', os.path.join('c', 'run', 'artifacts'), 'a', os.path.join('a', 'z'),
+                            os.path.join('c', 'run'), '.hidden']:
+                os.makedirs(os.path.join(root_dir, sub_dir), exist_ok=True)
+                with open(os.path.join(root_dir, sub_dir, 'performance-report.json'), 'w') as f:
+                    f.write('')
+
+            # Same paths in the same order (hence the same first test run) as the recursive glob
+            expected_paths = glob.glob(
+                os.path.join(root_dir, '**', 'performance-report.json'), recursive=True)
+            result_paths = find_files_by_name(root_dir, 'performance-report.json')
+
+        self.assertEqual(len(result_paths), 5)
+        self.assertEqual(result_paths, expected_paths)
+
+    def test_find_files_by_name_wo_existing_root_dir(self):
+        result_paths = find_files_by_name('non_existing_dir', 'performance-report.json')
+        self.assertEqual(result_paths, [])
+
+    def test_get_last_line_of_file(self):
+        # Copy the dummy JSON file with trailing blank lines, which are to be skipped
+        # (the dummy JSON file itself is shared by all tests, hence left unchanged)
+        file_path = os.path.join(self.tmp_dir.name, 'dummy_hunter_w_blank_lines.json')
+        with open(self.dummy_json_file_path, 'r') as dummy_json_file, open(file_path, 'w') as f:
+            f.write(f'{dummy_json_file.read()}\n  \n')
+
+        # A small block size to read the last line across several blocks
+        result_last_line = get_last_line_of_file(file_path, block_size=8)
+
+        self.assertIsInstance(result_last_line, bytes)
+        self.assertEqual(result_last_line, b'{"test_type": "10000-fixed", "changes": 35}')
+
+    def test_get_last_row_of_csv(self):
+        expected_last_row = {
+            'opRate.read': '9967', 'time': '2023-01-02 23:00:00 +0000', 'commit': 'abc1'}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_path = os.path.join(tmp_dir, 'hunter-lwt-fixed-100-partitions.csv')
+            with open(csv_path, 'w') as f:
+                f.write('opRate.read,time,commit\n')
+                f.write('9966,2023-01-01 23:00:00 +0000,abc0\n')
+                f.write('9967,2023-01-02 23:00:00 +0000,abc1\n')
+
+            # A small block size to read the last row across several blocks
+            result_last_row = get_last_row_of_csv(csv_path, block_size=8)
+
+        self.assertIsInstance(result_last_row, dict)
+        self.assertEqual(result_last_row, expected_last_row)
+
+    def test_get_numeric_metric(self):
+        self.assertEqual(get_numeric_metric('9966 op/sec'), 9966)
+        self.assertIsInstance(get_numeric_metric('9966 op/sec'), int)
+        self.assertEqual(get_numeric_metric('1.25 ms'), 1.25)
+        self.assertIsInstance(get_numeric_metric('1.25 ms'), float)
+        self.assertEqual(get_numeric_metric('9966 op/s'), 9966)
+        self.assertEqual(get_numeric_metric('1.2ms'), 1.2)
+        self.assertEqual(get_numeric_metric(6007010), 6007010)
+        self.assertEqual(get_numeric_metric('n/a'), 'n/a')
+        self.assertIsNone(get_numeric_metric(None))
+        self.assertTrue(math.isnan(get_numeric_metric(float('nan'))))
 
     def test_get_list_of_dict_from_json(self):
         expected_output = [